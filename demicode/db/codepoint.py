@@ -325,10 +325,10 @@ class CodePointSequence(tuple[CodePoint,...]):
         return self.__iter__()
 
     def __repr__(self) -> str:
-        return ' '.join(repr(cp) for cp in self)
+        return ' '.join(map(repr, self))
 
     def __str__(self) -> str:
-        return ''.join(chr(cp) for cp in self)
+        return ''.join(map(chr, self))
 
 
 # --------------------------------------------------------------------------------------
@@ -1,17 +1,21 @@
 from collections.abc import Iterable, Iterator
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from contextlib import AbstractContextManager, contextmanager
 import dataclasses
 from datetime import datetime, timedelta, timezone
-from io import StringIO
+import functools
+import gzip
+from io import BufferedIOBase, StringIO
 import json
 import logging
 import os
 from pathlib import Path
 import re
-import shutil
 import sys
 import tarfile
+import time
 from typing import Any, Callable, cast, ClassVar, IO, overload, Self
+from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from .. import __version__
@@ -29,10 +33,100 @@ _HTTP_CLDR_ACCEPT = (
     'application/vnd.npm.install-v1+json; q=1.0, application/json; q=0.8'
 )
 
+# Downloads are several megabytes large, so copy them in large chunks.
+_COPY_BUFFER_SIZE = 1 << 20
+
+
+# Retry requests that fail with one of these status codes or a timed out or reset
+# connection. Other failures, notably for name resolution, are unlikely to go away.
+_RETRY_STATUS = frozenset([500, 502, 503, 504])
+_MAX_ATTEMPTS = 4
+
+# Without a timeout, a blackholed connection only fails after the operating
+# system gives up, which can take minutes per attempt.
+_HTTP_TIMEOUT = 15.0
+
+
+def _is_transient(x: URLError) -> bool:
+    if isinstance(x, HTTPError):
+        return x.code in _RETRY_STATUS
+    return isinstance(x.reason, (TimeoutError, ConnectionError))
+
 
 def _make_request(url: str, **headers: str) -> Any:
-    """Request the resource with the given URL and return the response."""
-    return urlopen(Request(url, None, {'User-Agent': _HTTP_USER_AGENT} | headers))
+    """
+    Request the resource with the given URL and return the response. This
+    function retries transient failures with exponential backoff.
+    """
+    request = Request(url, None, {'User-Agent': _HTTP_USER_AGENT} | headers)
+    attempt = 1
+    while True:
+        try:
+            return urlopen(request, timeout=_HTTP_TIMEOUT)
+        except URLError as x:
+            if attempt == _MAX_ATTEMPTS or not _is_transient(x):
+                raise
+            if isinstance(x, HTTPError):
+                # An HTTP error doubles as response and must be closed.
+                x.close()
+            delay = 0.25 * 2 ** (attempt - 1)
+            _logger.info('retrying request for "%s" in %.2fs: %s', url, delay, x)
+            time.sleep(delay)
+            attempt += 1
+
+
+def _copy(source: BufferedIOBase, target: IO[bytes]) -> None:
+    """
+    Copy all bytes from source to target. Unlike `shutil.copyfileobj()`, this
+    function reads into the same buffer for every chunk instead of allocating a
+    new bytes object each time. Zero-copy alternatives such as `os.sendfile()`
+    do not apply, since TLS sockets must be decrypted in user space.
+    """
+    with memoryview(bytearray(_COPY_BUFFER_SIZE)) as buffer:
+        while count := source.readinto(buffer):
+            target.write(buffer[:count])
+
+
+def _list_files(directory: Path) -> set[str]:
+    """
+    Determine the names of regular files in the directory, which need not exist.
+    Listing a directory once is cheaper than checking each file with `stat()`.
+    """
+    try:
+        with os.scandir(directory) as scanner:
+            return {entry.name for entry in scanner if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _retrieve_if_modified(
+    url: str, etags: dict[str, str], *, size: int = -1, **headers: str
+) -> None | bytes:
+    """
+    Retrieve the resource with the given URL unless it still has the entity tag
+    recorded in `etags`. This function records the resource's current entity
+    tag in `etags` and returns `None` if the resource has not been modified. A
+    non-negative size limits how many bytes of the body are read.
+    """
+    previous = etags.get(url)
+    if previous is not None:
+        headers['If-None-Match'] = previous
+
+    try:
+        with _make_request(url, **headers) as response:
+            data = response.read(size)
+            current = response.headers.get('ETag')
+    except HTTPError as x:
+        if x.code == 304 and previous is not None:
+            _logger.info('resource "%s" has not been modified', url)
+            return None
+        raise
+
+    if current is None:
+        etags.pop(url, None)
+    else:
+        etags[url] = current
+    return data
 
 
 # --------------------------------------------------------------------------------------
@@ -45,10 +139,20 @@ class CLDR:
     derived_annotations: str
 
     @staticmethod
-    def retrieve_metadata(component: str) -> tuple[Version, str]:
+    def retrieve_metadata(
+        component: str, etags: None | dict[str, str] = None
+    ) -> None | tuple[Version, str]:
+        """
+        Retrieve the latest version and archive URL for the CLDR component. If
+        given entity tags, this method returns `None` for unmodified metadata.
+        """
         _logger.info('retrieving metadata for CLDR component "%s"', component)
-        with _make_request(component, Accept=_HTTP_CLDR_ACCEPT) as response:
-            metadata = json.load(response)
+        data = _retrieve_if_modified(
+            component, {} if etags is None else etags, Accept=_HTTP_CLDR_ACCEPT
+        )
+        if data is None:
+            return None
+        metadata = json.loads(data)
         version = metadata['dist-tags']['latest']
         archive = metadata['versions'][version]['dist']['tarball']
         _logger.info(
@@ -58,13 +162,32 @@ class CLDR:
         return Version.of(version), archive
 
     @classmethod
-    def from_registry(cls) -> Self:
+    def from_registry(cls, previous: 'CLDR', etags: dict[str, str]) -> Self:
+        """
+        Retrieve the latest CLDR components from the npm registry. Metadata
+        that has not been modified since the entity tags were recorded falls
+        back on the previous CLDR components. The derived annotations' metadata
+        is only retrieved if the annotations have a new version.
+        """
         v1, source1 = CLDR.retrieve_metadata(
-            'https://registry.npmjs.org/cldr-annotations-modern')
-        v2, source2 = CLDR.retrieve_metadata(
-            'https://registry.npmjs.org/cldr-annotations-derived-modern')
+            'https://registry.npmjs.org/cldr-annotations-modern', etags
+        ) or (previous.version, previous.annotations)
+        if v1 == previous.version:
+            # Both components are released in lockstep. So if one hasn't changed,
+            # neither has the other and there is no need for more metadata.
+            return cls(v1, source1, previous.derived_annotations)
+        derived = 'https://registry.npmjs.org/cldr-annotations-derived-modern'
+        metadata = CLDR.retrieve_metadata(derived, etags)
+        if metadata is None:
+            # The annotations have a new version and hence the derived ones must
+            # have one as well. So repeat the request without entity tag.
+            del etags[derived]
+            metadata = CLDR.retrieve_metadata(derived, etags)
+        if metadata is None:
+            raise AssertionError('unconditional request yields no CLDR metadata')
+        v2, source2 = metadata
         if v1 != v2:
-            raise VersionError('versions of CLDR annotations diverge: {v1} and {v2}')
+            raise VersionError(f'versions of CLDR annotations diverge: {v1} and {v2}')
         return cls(v1, source1, source2)
 
     @classmethod
@@ -86,27 +209,40 @@ class CLDR:
         return f'{stem}-{self.version}{suffix}'
 
     def retrieve(self, url: str, member: str, root: Path, stem: str) -> Path:
-        archive = root / self.filename(stem, '.tgz')
-        _logger.info('retrieving CLDR component from "%s" to "%s"', url, archive)
-        with _make_request(url) as response, open(archive, mode='wb') as file:
-            shutil.copyfileobj(response, file)
-
         path = root / self.filename(stem, '.json')
         tmp = path.with_suffix('.next.json')
-        _logger.info('extracting CLDR annotations "%s" to "%s"', member, path)
-        with tarfile.open(archive) as tarball:
-            # Make sure member is a file and not a symlink.
-            member_info = tarball.getmember(member)
-            if not member_info.isfile():
-                raise ValueError(
-                    f'member "{member}" of CLDR component "{url}" is not a file')
+        _logger.info(
+            'extracting CLDR annotations "%s" from "%s" to "%s"', member, url, path
+        )
+        # Decompress and extract the archive while it is being downloaded. Since
+        # a streamed archive cannot seek, look for the member in a single pass.
+        try:
+            with (
+                _make_request(url) as response,
+                tarfile.open(
+                    fileobj=response, mode='r|gz', bufsize=_COPY_BUFFER_SIZE
+                ) as tarball,
+            ):
+                for member_info in tarball:
+                    if member_info.name == member:
+                        break
+                else:
+                    raise ValueError(
+                        f'CLDR component "{url}" does not contain member "{member}"')
 
-            with cast(IO[bytes], tarball.extractfile(member)) as source:
-                with open(tmp, mode='wb') as target:
-                    shutil.copyfileobj(source, target)
+                # Make sure member is a file and not a symlink.
+                if not member_info.isfile():
+                    raise ValueError(
+                        f'member "{member}" of CLDR component "{url}" is not a file')
+
+                with cast(BufferedIOBase, tarball.extractfile(member_info)) as source:
+                    with open(tmp, mode='wb') as target:
+                        _copy(source, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
         tmp.replace(path)
-        archive.unlink()
         return path
 
     def retrieve_all(
@@ -114,6 +250,8 @@ class CLDR:
         root: Path,
         tick: None | Callable[[], None] = None
     ) -> None:
+        existing = _list_files(root)
+        missing: list[tuple[str, str, str]] = []
         for url, member, stem in (
             (
                 self.annotations,
@@ -126,8 +264,18 @@ class CLDR:
                 'derived-annotations',
             )
         ):
-            if not (root / self.filename(stem, '.json')).is_file():
-                self.retrieve(url, member, root, stem)
+            if self.filename(stem, '.json') not in existing:
+                missing.append((url, member, stem))
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = [
+                executor.submit(self.retrieve, url, member, root, stem)
+                for url, member, stem in missing
+            ]
+            for future in as_completed(futures):
+                future.result()
                 if tick:
                     tick()
 
@@ -135,8 +283,9 @@ class CLDR:
 # --------------------------------------------------------------------------------------
 
 
+_UCD_README_PREFIX = 4096
 _UCD_VERSION_PATTERN = (
-    re.compile(r'Version (?P<version>\d+[.]\d+[.]\d+) of the Unicode Standard')
+    re.compile(rb'Version (?P<version>\d+[.]\d+[.]\d+) of the Unicode Standard')
 )
 
 
@@ -145,7 +294,8 @@ def _to_manifest_path(mirror: Path) -> Path:
 
 
 def _check_mirror_path(mirror: Path) -> None:
-    if mirror.exists() and not mirror.is_dir():
+    # Check is_dir() first, since it suffices for an existing mirror.
+    if not mirror.is_dir() and mirror.exists():
         raise NotADirectoryError(str(mirror))
 
 
@@ -178,6 +328,7 @@ class Manifest:
     versions: tuple[Version, ...]
     cldr: CLDR
     timestamp: datetime
+    etags: tuple[tuple[str, str], ...] = ()
 
     VOID: ClassVar[int] = 0
     SCHEMA: ClassVar[int] = 1
@@ -253,7 +404,8 @@ class Manifest:
             Version.of(data['ucd']),
             tuple(sorted(Version.of(v) for v in data['versions'])),
             CLDR.from_dict(data['cldr']),
-            datetime.fromisoformat(data['timestamp'])
+            datetime.fromisoformat(data['timestamp']),
+            tuple(data.get('etags', {}).items()),
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -264,6 +416,7 @@ class Manifest:
             'versions': [str(v) for v in self.versions],
             'cldr': self.cldr.to_dict(),
             'timestamp': self.timestamp.isoformat(),
+            'etags': dict(self.etags),
         }
 
     @classmethod
@@ -292,29 +445,51 @@ class Manifest:
             )
 
     @staticmethod
-    def retrieve_ucd_version() -> Version:
+    def retrieve_ucd_version(etags: None | dict[str, str] = None) -> None | Version:
+        """
+        Retrieve the latest UCD version. If given entity tags, this method
+        returns `None` if the UCD's read-me has not been modified.
+        """
         url = 'https://www.unicode.org/Public/UCD/latest/ReadMe.txt'
         _logger.info('retrieving latest UCD version from "%s"', url)
-        with _make_request(url) as response:
-            text = response.read().decode('utf8')
+        # The version appears in the first few lines, so only read a prefix.
+        data = _retrieve_if_modified(
+            url, {} if etags is None else etags, size=_UCD_README_PREFIX
+        )
+        if data is None:
+            return None
 
-        if (match := _UCD_VERSION_PATTERN.search(text)) is None:
+        # The version is ASCII, so there is no need to decode the text.
+        match = _UCD_VERSION_PATTERN.search(data)
+        if match is None and len(data) == _UCD_README_PREFIX:
+            _logger.info('retrieving all of "%s" to find UCD version', url)
+            match = _UCD_VERSION_PATTERN.search(
+                cast(bytes, _retrieve_if_modified(url, {}))
+            )
+        if match is None:
             msg = 'latest "ReadMe.txt" in UCD elides version number'
             raise VersionError(msg)
 
-        version = Version.of(match.group('version'))
+        version = Version.of(match.group('version').decode('ascii'))
         _logger.info('latest UCD version is %s', version)
         assert version.is_supported_ucd()
         return version
 
     @classmethod
-    def from_origin(cls, mirror: str | Path) -> Self:
+    def from_origin(cls, mirror: str | Path, previous: 'Manifest') -> Self:
+        """
+        Create a new manifest with the latest UCD and CLDR versions. Conditional
+        requests based on the previous manifest's entity tags avoid transferring
+        metadata that has not been modified.
+        """
         mirror = Path(mirror).resolve()
         _check_mirror_path(mirror)
-        ucd = Manifest.retrieve_ucd_version()
+        etags = dict(previous.etags)
+        ucd = Manifest.retrieve_ucd_version(etags) or previous.ucd
+        cldr = CLDR.from_registry(previous.cldr, etags)
         ts = datetime.now(timezone.utc)
 
-        return cls(cls.SCHEMA, mirror, ucd, (), CLDR.from_registry(), ts)
+        return cls(cls.SCHEMA, mirror, ucd, (), cldr, ts, tuple(etags.items()))
 
     def with_inventory(self, *versions: Version) -> Self:
         self.check_not_void()
@@ -375,13 +550,21 @@ class Manifest:
         if previous.younger_than(timedelta(weeks=1)):
             return previous
 
-        # Determine latest UCD version (from_origin), ensure its files are
-        # locally mirrored (sync), and save the manifest (save_manifest).
-        return (
-            cls.from_origin(mirror)
-            .sync(previous, tick)
-            .save_manifest()
-        )
+        # Determine latest UCD version (from_origin). If the origin servers are
+        # unreachable, fall back on a stale but otherwise usable manifest.
+        try:
+            current = cls.from_origin(mirror, previous)
+        except URLError as x:
+            if previous.schema == cls.VOID:
+                raise
+            _logger.warning(
+                'using stale manifest "%s", since origin is unreachable: %s',
+                previous.path, x
+            )
+            return previous
+
+        # Ensure files are locally mirrored (sync) and save the manifest.
+        return current.sync(previous, tick).save_manifest()
 
     def require(
         self,
@@ -430,8 +613,48 @@ _UCD_FILES = _EMOJI_FILES + (
     'UnicodeData.txt',
 )
 
+# The number of concurrent downloads from the UCD's origin server.
+_MAX_DOWNLOADS = 6
+
 _LOOSE_VERSION_PATTERN = re.compile(r'[0-9]+[.][0-9]+([.][0-9]+)')
-_STRICT_VERSION_PATTERN = re.compile(r'[1-9][0-9]*[.](0|[1-9][0-9]*)[.](0|[1-9][0-9]*)')
+_STRICT_VERSION_PATTERN = re.compile(
+    r'(?P<major>[1-9][0-9]*)[.](?P<minor>0|[1-9][0-9]*)[.](?P<patch>0|[1-9][0-9]*)'
+)
+
+
+# Mirroring and accessing data for several versions determines the same URLs over
+# and over again. Hence the file manager caches them.
+@functools.lru_cache(maxsize=None)
+def _ucd_url(filename: str, version: Version, ucd: Version) -> None | str:
+    _check_ucd_version(version)
+    if version > ucd:
+        raise VersionError(f'v{version} has not been released')
+    elif filename in ('GraphemeBreakProperty.txt', 'GraphemeBreakTest.txt'):
+        path = f'{version}/ucd/auxiliary'
+    elif filename in ('DerivedCombiningClass.txt', 'DerivedGeneralCategory.txt'):
+        path = f'{version}/ucd/extracted'
+    elif filename in _CORE_EMOJI_FILES and version >= (13, 0, 0):
+        path = f'{version}/ucd/emoji'
+    elif filename in _EMOJI_FILES:
+        emo_version = version.to_emoji()
+        if (
+            filename == 'emoji-variation-sequences.txt' and emo_version <= (4, 0, 0)
+            or filename == 'emoji-test.txt' and emo_version <= (3, 0, 0)
+            or filename != 'emoji-data.txt' and emo_version <= (1, 0, 0)
+            or emo_version.major == 0
+        ):
+            return None
+
+        path = f'emoji/{emo_version.in_short_format()}'
+    elif filename == 'IndicSyllabicCategory.txt' and version < (6, 0, 0):
+        # File was provisional in 6.0 and became normative in 7.0
+        return None
+    elif filename in _UCD_FILES:
+        path = f'{version}/ucd'
+    else:
+        raise ValueError(f'"{filename}" is not a supported UCD file')
+
+    return f'https://www.unicode.org/Public/{path}/{filename}'
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -451,35 +674,7 @@ class FileManager:
         returns `None` if file and version are valid but the file has not been
         released for the UCD version.
         """
-        _check_ucd_version(version)
-        if version > self.ucd:
-            raise VersionError(f'v{version} has not been released')
-        elif filename in ('GraphemeBreakProperty.txt', 'GraphemeBreakTest.txt'):
-            path = f'{version}/ucd/auxiliary'
-        elif filename in ('DerivedCombiningClass.txt', 'DerivedGeneralCategory.txt'):
-            path = f'{version}/ucd/extracted'
-        elif filename in _CORE_EMOJI_FILES and version >= (13, 0, 0):
-            path = f'{version}/ucd/emoji'
-        elif filename in _EMOJI_FILES:
-            emo_version = version.to_emoji()
-            if (
-                filename == 'emoji-variation-sequences.txt' and emo_version <= (4, 0, 0)
-                or filename == 'emoji-test.txt' and emo_version <= (3, 0, 0)
-                or filename != 'emoji-data.txt' and emo_version <= (1, 0, 0)
-                or emo_version.major == 0
-            ):
-                return None
-
-            path = f'emoji/{emo_version.in_short_format()}'
-        elif filename == 'IndicSyllabicCategory.txt' and version < (6, 0, 0):
-            # File was provisional in 6.0 and became normative in 7.0
-            return None
-        elif filename in _UCD_FILES:
-            path = f'{version}/ucd'
-        else:
-            raise ValueError(f'"{filename}" is not a supported UCD file')
-
-        return f'https://www.unicode.org/Public/{path}/{filename}'
+        return _ucd_url(filename, version, self.ucd)
 
     def path(self, filename: str, version: Version) -> Path:
         return self.mirror / str(version) / filename
@@ -487,8 +682,23 @@ class FileManager:
     def retrieve(self, url: str, path: Path) -> Path:
         _logger.info('retrieving UCD file from "%s" to "%s"', url, path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with _make_request(url) as response, open(path, mode='wb') as file:
-            shutil.copyfileobj(response, file)
+        # Since retrieve_all() treats existing files as mirrored, write to a
+        # temporary file first and only then move the file into place.
+        tmp = path.with_suffix(f'.next{path.suffix}')
+        # UCD files are plain text and compress well.
+        try:
+            with (
+                _make_request(url, **{'Accept-Encoding': 'gzip'}) as response,
+                open(tmp, mode='wb') as file,
+            ):
+                source = response
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    source = gzip.GzipFile(fileobj=response, mode='rb')
+                _copy(source, file)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        tmp.replace(path)
         return path
 
     @overload
@@ -526,64 +736,97 @@ class FileManager:
 
         tick = __tick or (lambda: None)
 
+        missing: list[tuple[str, Path]] = []
         for version in versions:
+            directory = self.mirror / str(version)
+            existing = _list_files(directory)
             for filename in _UCD_FILES:
                 url = self.url(filename, version)
-                if url is not None:
-                    path = self.path(filename, version)
-                    if not path.is_file():
-                        self.retrieve(url, path)
-                        tick()
+                if url is not None and filename not in existing:
+                    missing.append((url, directory / filename))
+        if not missing:
+            return
+
+        # Downloads are dominated by network latency, so fetch files
+        # concurrently. But keep ticking on the calling thread.
+        with ThreadPoolExecutor(max_workers=_MAX_DOWNLOADS) as executor:
+            futures = [
+                executor.submit(self.retrieve, url, path) for url, path in missing
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    tick()
+            except BaseException:
+                # Fail fast by not starting any of the remaining downloads.
+                executor.shutdown(cancel_futures=True)
+                raise
 
     def scan_retrieved_versions(self) -> list[Version]:
         """
         Scan mirror for retrieved versions. Since this method does not check for
         a version's files, consider invoking retrieve_all() on the result.
         """
-        if not self.mirror.exists():
+        # Directory entries cache their type, so is_dir() needs no extra stat().
+        try:
+            scanner = os.scandir(self.mirror)
+        except FileNotFoundError:
             _logger.info('mirror "%s" does not (yet) exist', self.mirror)
             return []
 
         _logger.info('scanning mirror "%s" for versions', self.mirror)
         result: list[Version] = []
 
-        for entry in self.mirror.iterdir():
-            if not _LOOSE_VERSION_PATTERN.match(entry.name):
-                continue
-            if not _STRICT_VERSION_PATTERN.match(entry.name):
-                raise VersionError(
-                    f'unexpected entry "{entry.name}" in mirror '
-                    f'directory "{self.mirror}"; please remove'
-                )
-            if not entry.is_dir():
-                raise VersionError(
-                    f'entry "{entry.name}" in mirror directory "{self.mirror}" '
-                    'is not a directory; please remove'
-                )
-
-            version = Version.of(entry.name)
-            if not version.is_supported_ucd() or version > self.ucd:
-                raise VersionError(
-                    f'entry "{entry.name}" in mirror directory "{self.mirror}" '
-                    'is not a valid UCD version; please remove'
+        with scanner:
+            for entry in scanner:
+                # Most entries are versions, so try the strict pattern first.
+                match = _STRICT_VERSION_PATTERN.fullmatch(entry.name)
+                if match is None:
+                    if not _LOOSE_VERSION_PATTERN.match(entry.name):
+                        continue
+                    raise VersionError(
+                        f'unexpected entry "{entry.name}" in mirror '
+                        f'directory "{self.mirror}"; please remove'
+                    )
+                if not entry.is_dir():
+                    raise VersionError(
+                        f'entry "{entry.name}" in mirror directory '
+                        f'"{self.mirror}" is not a directory; please remove'
+                    )
+
+                version = Version(
+                    int(match['major']), int(match['minor']), int(match['patch'])
                 )
+                if not version.is_supported_ucd() or version > self.ucd:
+                    raise VersionError(
+                        f'entry "{entry.name}" in mirror directory '
+                        f'"{self.mirror}" is not a valid UCD version; please remove'
+                    )
 
-            result.append(version)
+                result.append(version)
 
         return result
 
     @contextmanager
     def data(self, filename: str, version: Version) -> Iterator[IO[str]]:
         path = self.path(filename, version)
-        if not path.is_file():
+        # Opening the file doubles as existence check, saving a stat() per file.
+        file: None | IO[str] = None
+        try:
+            file = open(path, mode='r', encoding='utf8')
+        except FileNotFoundError:
             # Raises upon invalid filename or version
-            url = self.url(filename, version)
-            if url is None:
-                yield StringIO()
-                return
-            # We used to self.retrieve(url, path) here. But now we support only
-            # versions appearing in manifest. So we let open() raise an error.
-        with open(path, mode='r', encoding='utf8') as file:
+            if self.url(filename, version) is not None:
+                # We used to self.retrieve(url, path) here. But now we support
+                # only versions appearing in manifest. So we re-raise the error.
+                raise
+
+        # Yield outside the exception handler, so that exceptions raised by the
+        # caller are not chained to FileNotFoundError.
+        if file is None:
+            yield StringIO()
+            return
+        with file:
             yield file
 
 
@@ -244,13 +244,7 @@ class Presentation(Enum):
 
     def apply(self, codepoint: CodePoint) -> str:
         """Apply this presentation to the code point, yielding a string."""
-        match self:
-            case Presentation.NONE:
-                return chr(codepoint)
-            case Presentation.KEYCAP:
-                return f'{chr(codepoint)}\uFE0F\u20E3'
-            case _:
-                return f'{chr(codepoint)}{chr(self.value)}'
+        return chr(codepoint) + _PRESENTATION_SUFFIX[self]
 
     @property
     def is_heading(self) -> bool:
@@ -281,6 +275,18 @@ class Presentation(Enum):
         )
 
 
+# Presentation.apply() runs once per blot and hence looks up the suffix instead of
+# matching on the presentation. HEADING has no suffix, since it has no code point.
+_PRESENTATION_SUFFIX: dict[Presentation, str] = {
+    Presentation.NONE: '',
+    Presentation.CORNER: '\uFE00',
+    Presentation.CENTER: '\uFE01',
+    Presentation.TEXT: '\uFE0E',
+    Presentation.EMOJI: '\uFE0F',
+    Presentation.KEYCAP: '\uFE0F\u20E3',
+}
+
+
 # --------------------------------------------------------------------------------------
 # A Code Point with Properties
 
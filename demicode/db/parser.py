@@ -1,4 +1,5 @@
 from collections.abc import Iterable, Iterator
+import functools
 import re
 from typing import Callable, cast, Literal, TypeAlias, TypeVar
 
@@ -98,19 +99,26 @@ def parse(
 ) -> Iterator[T]:
     """
     Parse the lines of a UCD file into application-specific records. This
-    function uses `parse_lines()` to parse lines into generic tuples, ignores
+    function parses lines into generic tuples just like `parse_lines()`, ignores
     default values, converts tuples to application-specific records, and yields
-    the non-`None` results.
+    the non-`None` results. Since it ignores default values anyway, it skips
+    all comment lines directly instead of delegating to `parse_lines()`.
     """
-    for tag, codepoints, properties in parse_lines(
-        lines,
-        with_codepoints=with_codepoints,
-        with_comment=with_comment,
-    ):
-        if tag is None:
-            record = constructor(codepoints, properties)
-            if record is not None:
-                yield record
+    for line in lines:
+        if line in ('', '\n'):
+            continue
+        elif line[0] == '#':
+            if line.startswith(_EOF):
+                return
+            continue
+
+        record = constructor(*_parse_line(
+            line,
+            with_codepoints=with_codepoints,
+            with_comment=with_comment,
+        ))
+        if record is not None:
+            yield record
 
 
 # --------------------------------------------------------------------------------------
@@ -119,11 +127,15 @@ def parse(
 
 _FIXABLE = re.compile(r'[- ][a-z]?')
 
+@functools.lru_cache(maxsize=None)
 def to_property_value(value: str) -> str:
     """
     Normalize a property value. This function replaces any space or dash with an
-    underscore and capitalizes the `a` in `and`.
+    underscore and capitalizes the `a` in `and`. Since the same few hundred
+    values recur across files and versions, this function is cached.
     """
+    if ' ' not in value and '-' not in value:
+        return value
     return _FIXABLE.sub(
         lambda m: '_' + t[1].upper() if len(t := m[0]) == 2 else '_', value
     )
@@ -149,9 +161,14 @@ def no_range(codepoints: CodePoints) -> CodePointOrSequence:
     raise TypeError(f'code point range {codepoints!r} where none expected')
 
 
-def get_range(record: tuple[CodePointRange, object]) -> CodePointRange:
-    """Retrieve the range from a parsed record"""
-    return record[0]
+def get_range_start(record: tuple[CodePointRange, object]) -> CodePoint:
+    """
+    Retrieve the first code point of the range from a parsed record. Since the
+    ranges of a property file do not overlap, this is a valid sort key. Unlike
+    the range itself, it compares as a plain integer and hence does not invoke
+    `CodePointRange.__lt__()` for every comparison.
+    """
+    return record[0].start
 
 
 # --------------------------------------------------------------------------------------
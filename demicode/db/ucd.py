@@ -1,6 +1,7 @@
 from bisect import bisect_right as stdlib_bisect_right
 from collections import Counter, defaultdict
 from collections.abc import Iterator, Sequence, Set
+import functools
 import itertools
 import json
 import logging
@@ -30,13 +31,14 @@ from .model import (
     Grapheme_Cluster_Break,
     Indic_Conjunct_Break,
     Indic_Syllabic_Category,
+    Presentation,
     Property,
     PropertyId,
     Script,
 )
 
 from .parser import (
-    get_range,
+    get_range_start,
     no_range,
     parse,
     simplify_range_data,
@@ -70,6 +72,25 @@ _FULLWIDTH_PUNCTUATION = frozenset(CodePoint.of(cp) for cp in (
 ))
 
 
+# --------------------------------------------------------------------------------------
+# Presentations of code points
+
+
+_NO_PRESENTATIONS = (Presentation.NONE,)
+_FULLWIDTH_PRESENTATIONS = (Presentation.CORNER, Presentation.CENTER)
+_VARIATION_PRESENTATIONS = (Presentation.NONE, Presentation.TEXT, Presentation.EMOJI)
+_KEYCAP_PRESENTATIONS = (*_VARIATION_PRESENTATIONS, Presentation.KEYCAP)
+
+
+# --------------------------------------------------------------------------------------
+# Widths of blots
+
+
+# Enough for the blots of a few full-screen pages, so that paging back and forth
+# hits the cache while the memory it retains remains bounded.
+_WIDTH_CACHE_SIZE = 1_024
+
+
 # --------------------------------------------------------------------------------------
 # Load some of the more complex UCD Files
 
@@ -211,6 +232,16 @@ class UnicodeCharacterDatabase:
         tick: None | Callable[[], None] = None,
     ) -> None:
         self._is_optimized: bool = False
+        self._character_data: dict[CodePoint, CharacterData] = {}
+        # A dense table for the BMP, with 0 for unknown or the width plus 2.
+        self._bmp_width = bytearray(0x10000)
+        self._width = functools.lru_cache(maxsize=_WIDTH_CACHE_SIZE)(
+            self._compute_width
+        )
+        self._is_grapheme_cluster: dict[str | CodePointSequence, bool] = {}
+        self._emoji_sequence_data: dict[
+            str | CodePoint | CodePointSequence, tuple[None | str, None | Version]
+        ] = {}
 
         self._mirror = mirror = Mirror(root, version, tick)
         version = mirror.version
@@ -220,7 +251,7 @@ class UnicodeCharacterDatabase:
         with mirror.data('DerivedAge.txt', version) as lines:
             self._age = sorted(parse(
                 lines, lambda cp, p: (cp.to_range(), Age(p[0]))
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('Blocks.txt', version) as lines:
             self._block = [*parse(
                 lines, lambda cp, p: (cp.to_range(), Block[to_property_value(p[0])])
@@ -228,7 +259,7 @@ class UnicodeCharacterDatabase:
         with mirror.data('DerivedCombiningClass.txt', version) as lines:
             self._combining_class = sorted(parse(
                 lines, lambda cp, p: (cp.to_range(), int(p[0]))
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('DerivedCoreProperties.txt', version) as lines:
             self._default_ignorable = [*parse(lines, lambda cp, p: (
                 cp.to_range()
@@ -251,6 +282,15 @@ class UnicodeCharacterDatabase:
             self._emoji_variations = frozenset(dict.fromkeys(parse(
                 lines, lambda cp, _: cp.to_sequence_head()
             )))
+        # Only code points with alternative presentations have entries.
+        self._presentations: dict[CodePoint, tuple[Presentation, ...]] = {
+            **dict.fromkeys(self._emoji_variations, _VARIATION_PRESENTATIONS),
+            **dict.fromkeys(
+                _COMBINE_WITH_ENCLOSING_KEYCAPS & self._emoji_variations,
+                _KEYCAP_PRESENTATIONS,
+            ),
+            **dict.fromkeys(_FULLWIDTH_PUNCTUATION, _FULLWIDTH_PRESENTATIONS),
+        }
         with mirror.data('DerivedGeneralCategory.txt', version) as lines:
             # The file covers *all* Unicode code points, so we drop Unassigned.
             # That's consistent with the default category for UnicodeData.txt.
@@ -259,19 +299,19 @@ class UnicodeCharacterDatabase:
                 lines, lambda cp, p: (
                     None if p[0] == 'Cn' else (cp.to_range(), General_Category(p[0]))
                 )
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('GraphemeBreakProperty.txt', version) as lines:
             self._grapheme_break = sorted(parse(
                 lines, lambda cp, p: (cp.to_range(), Grapheme_Cluster_Break[p[0]])
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('DerivedCoreProperties.txt', version) as lines:
             self._indic_conjunct_break = sorted(parse(lines, lambda cp, p: (
                 (cp.to_range(), Indic_Conjunct_Break(p[1])) if p[0] == 'InCB' else None
-            )))
+            )), key=get_range_start)
         with mirror.data('IndicSyllabicCategory.txt', version) as lines:
             self._indic_syllabic = sorted(parse(
                 lines, lambda cp, p: (cp.to_range(), Indic_Syllabic_Category[p[0]])
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('UnicodeData.txt', version) as lines:
             self._name = dict(parse(lines, lambda cp, p: (
                 None if p[0].startswith('<') else (cp.to_singleton(), p[0])
@@ -279,7 +319,7 @@ class UnicodeCharacterDatabase:
         with mirror.data('Scripts.txt', version) as lines:
             self._script = sorted(parse(
                 lines, lambda cp, p: (cp.to_range(), Script[p[0]])
-            ), key=get_range)
+            ), key=get_range_start)
         with mirror.data('PropList.txt', version) as lines:
             self._white_space = [*parse(lines, lambda cp, p: (
                 cp.to_range()
@@ -328,6 +368,12 @@ class UnicodeCharacterDatabase:
         if invalid:
             raise AssertionError('UCD is missing data; see log messages')
 
+        # Most sequences looked up are not emoji. Their first code point rules
+        # them out without hashing the entire sequence.
+        self._emoji_sequence_heads = frozenset(
+            cp.to_sequence_head() for cp in self._emoji_sequences
+        )
+
     def optimize(self) -> Self:
         if self._is_optimized:
             return self
@@ -431,15 +477,23 @@ class UnicodeCharacterDatabase:
     # Property Lookup
 
     def lookup(self, codepoint: CodePoint) -> CharacterData:
-        return CharacterData(
-            codepoint=codepoint,
-            category=self.resolve(codepoint, General_Category),
-            east_asian_width=self.resolve(codepoint, East_Asian_Width),
-            age=self.resolve(codepoint, Age),
-            name=self._name.get(codepoint),
-            block=self.resolve(codepoint, Block),
-            flags=frozenset(p for p in BinaryProperty if self.test(codepoint, p)),
-        )
+        """
+        Look up the code point's properties. Since displaying code points looks
+        up the same code points whenever paging back and forth, this method
+        caches the immutable result.
+        """
+        data = self._character_data.get(codepoint)
+        if data is None:
+            data = self._character_data[codepoint] = CharacterData(
+                codepoint=codepoint,
+                category=self.resolve(codepoint, General_Category),
+                east_asian_width=self.resolve(codepoint, East_Asian_Width),
+                age=self.resolve(codepoint, Age),
+                name=self._name.get(codepoint),
+                block=self.resolve(codepoint, Block),
+                flags=frozenset(p for p in BinaryProperty if self.test(codepoint, p)),
+            )
+        return data
 
     def grapheme_cluster(self, codepoint: CodePoint) -> Grapheme_Cluster_Break:
         """Look up the code point's grapheme cluster."""
@@ -518,11 +572,20 @@ class UnicodeCharacterDatabase:
         grapheme cluster. So invoking this method on a known code point makes
         little sense. This method nonetheless accepts code points to simplify
         calling code, which often handles code points and code point sequences
-        interchangeably.
+        interchangeably. Results for strings and sequences are memoized.
         """
         if isinstance(text, CodePoint):
             return True
-        return [*self.grapheme_cluster_breaks(text)] == [0, len(text)]
+        result = self._is_grapheme_cluster.get(text)
+        if result is None:
+            # A single grapheme cluster is matched in its entirety by one match.
+            grapheme = GRAPHEME_CLUSTER_PATTERN.match(
+                self._to_grapheme_cluster_string(text)
+            )
+            result = self._is_grapheme_cluster[text] = (
+                grapheme is not None and grapheme.end() == len(text)
+            )
+        return result
 
     # ----------------------------------------------------------------------------------
     # Test Binary Properties, Count Properties
@@ -728,10 +791,13 @@ class UnicodeCharacterDatabase:
         such a sequence indeed. This method only works if the code points
         argument has been converted to the right types with `_to_codepoints()`.
         """
+        if isinstance(codepoints, CodePoint):
+            return self._emoji_sequences.get(codepoints)
+        if codepoints[0] not in self._emoji_sequence_heads:
+            return None
         result = self._emoji_sequences.get(codepoints)
-        if result is not None or codepoints.is_singleton():
+        if result is not None:
             return result
-        codepoints = codepoints.to_sequence()  # Keep mypy happy
         if len(codepoints) != 2 or codepoints[1] != CodePoint.EMOJI_VARIATION_SELECTOR:
             return None
         return self._emoji_sequences.get(codepoints[0])
@@ -754,9 +820,15 @@ class UnicodeCharacterDatabase:
         Get the CLDR name and Unicode Emoji age for the emoji sequence.
         Unlike Unicode Emoji's files, this method recognizes code points that
         have emoji presentation and are followed by the emoji variation
-        selector.
+        selector. Since displaying code points looks up the same sequences
+        whenever paging back and forth, this method caches results.
         """
-        return self._to_emoji_info(self._to_codepoints(codepoints)) or (None, None)
+        data = self._emoji_sequence_data.get(codepoints)
+        if data is None:
+            data = self._emoji_sequence_data[codepoints] = (
+                self._to_emoji_info(self._to_codepoints(codepoints)) or (None, None)
+            )
+        return data
 
     def extended_pictographic_ranges(self) -> Iterator[CodePointRange]:
         """
@@ -789,14 +861,33 @@ class UnicodeCharacterDatabase:
         """
         return self._emoji_variations
 
+    def presentations(self, codepoint: CodePoint) -> tuple[Presentation, ...]:
+        """
+        Determine the presentations to display for the code point with a single
+        look-up: corner and center for fullwidth punctuation; none, text, and
+        emoji for variations, plus keycap if applicable; and otherwise none.
+        """
+        return self._presentations.get(codepoint, _NO_PRESENTATIONS)
+
     # ----------------------------------------------------------------------------------
     # Width
 
     def width1(self, codepoint: CodePoint) -> int:
         """
         Determine [wcwidth](https://www.cl.cam.ac.uk/~mgk25/ucs/wcwidth.c) of a
-        single code point.
+        single code point. Since the vast majority of displayed code points are
+        in the basic multilingual plane, this method memoizes their widths in a
+        dense table indexed by code point.
         """
+        if codepoint < 0x10000:
+            width = self._bmp_width[codepoint] - 2
+            if width == -2:
+                width = self._width1(codepoint)
+                self._bmp_width[codepoint] = width + 2
+            return width
+        return self._width1(codepoint)
+
+    def _width1(self, codepoint: CodePoint) -> int:
         category = self.resolve(codepoint, General_Category)
 
         if (
@@ -826,6 +917,14 @@ class UnicodeCharacterDatabase:
         )
 
     def width(self, codepoints: str | CodePointSequence | CodePoint) -> int:
+        """
+        Determine the width of the string, code point, or sequence of code
+        points. Since paging back and forth displays the same blots again and
+        again, this method memoizes the results for the most recent few pages.
+        """
+        return self._width(codepoints)
+
+    def _compute_width(self, codepoints: str | CodePointSequence | CodePoint) -> int:
         codepoints = self._to_codepoints(codepoints)
 
         # First, check for emoji
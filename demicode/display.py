@@ -7,18 +7,23 @@ as requested by the user. When displaying a new page, it also updates the
 terminal size to ensure that the output fits into the window.
 """
 
-from collections.abc import Iterator, Iterable
+from collections.abc import Iterator, Iterable, Sequence
 from contextlib import ExitStack
-import itertools
-import math
-from typing import Callable, cast
+import functools
+from typing import Callable, TypeAlias, cast
 
 from .benchmark import Probe
 from .db.codepoint import CodePoint, CodePointSequence
-from .db.model import Age, General_Category, Presentation
+from .db.model import (
+    Age,
+    BinaryProperty,
+    East_Asian_Width,
+    General_Category,
+    Presentation,
+)
 from .db.ucd import UnicodeCharacterDatabase
 from .ui.control import Action, read_line_action
-from .ui.render import Padding, Renderer
+from .ui.render import fit_text, Padding, Renderer
 from .ui.terminal import Terminal
 from . import __version__
 
@@ -40,8 +45,21 @@ def make_presentable(
     followed by U+0080, pad, that padding is stripped from the code points and
     the presentation becomes the default `NONE`. In other words, U+0080 disables
     this function's enrichment with presentation for a given code point.
+
+    Sequences that end with a presentation's code points are normalized to the
+    base code point and that presentation. Since this function runs only once
+    per display, `emit_blot()` and `emit_info()` need not normalize on every
+    page.
     """
+    presentations = ucd.presentations
+
     for datum in data:
+        # Code points are by far the most common input, so handle them first.
+        if isinstance(datum, CodePoint):
+            for presentation in presentations(datum):
+                yield presentation, datum
+            continue
+
         if isinstance(datum, str):
             if not datum:
                 continue
@@ -54,22 +72,14 @@ def make_presentable(
         if not datum.is_singleton():
             datum = datum.to_sequence()
             if len(datum) == 2 and datum[1] == CodePoint.PAD:
-                datum = datum[0]
-            yield Presentation.NONE, datum
+                yield Presentation.NONE, datum[0]
+            else:
+                yield Presentation.NONE.normalize(datum)
             continue
 
         datum = datum.to_singleton()
-        if datum in ucd.fullwidth_punctuation:
-            yield Presentation.CORNER, datum
-            yield Presentation.CENTER, datum
-        elif datum in ucd.with_emoji_variation:
-            yield Presentation.NONE, datum
-            yield Presentation.TEXT, datum
-            yield Presentation.EMOJI, datum
-            if datum in ucd.with_keycap:
-                yield Presentation.KEYCAP, datum
-        else:
-            yield Presentation.NONE, datum
+        for presentation in presentations(datum):
+            yield presentation, datum
 
 
 # --------------------------------------------------------------------------------------
@@ -95,9 +105,50 @@ def _name_width(width: int) -> int:
     return width - FIXED_WIDTH
 
 
+# Unlike f-strings with a nested width, bound format methods parse the
+# format spec only once.
+_format_sequence_age = f" {{:>{AGE_WIDTH}}}".format
+_format_fixed_columns = f"{{:<8}} {{}}{{}} {{:>{AGE_WIDTH}}} ".format
+_BLANK_AGE = " " * (AGE_WIDTH + 1)
+
+
+def _format_variation_selector(presentation: Presentation) -> str:
+    vs = presentation.variation_selector
+    return f"{vs - CodePoint.VARIATION_SELECTOR_1 + 1:>2} " if vs > 0 else "   "
+
+
+# The variation selector column only depends on the presentation.
+_VARIATION_SELECTOR_LABEL: dict[Presentation, str] = {
+    presentation: _format_variation_selector(presentation)
+    for presentation in Presentation
+    if not presentation.is_heading
+}
+
+
+FLAGS_WIDTH = 25
+
+
+@functools.lru_cache(maxsize=None)
+def _format_properties(
+    category: General_Category,
+    east_asian_width: East_Asian_Width,
+    flags: frozenset[BinaryProperty],
+) -> str:
+    """
+    Format general category, East Asian width, and binary properties, with the
+    latter fit into their column. There are only a few hundred combinations.
+    """
+    text = fit_text(" ".join(f.value for f in flags), FLAGS_WIDTH, fill=True)
+    return f"{category.value} {east_asian_width:<2} {text}"
+
+
 def format_legend(renderer: Renderer) -> str:
     """Format the per-page legend."""
-    return LEGEND.ljust(renderer.width) if renderer.has_style else LEGEND[6:]
+    return _format_legend(renderer.width, renderer.has_style)
+
+
+def _format_legend(width: int, has_style: bool) -> str:
+    return LEGEND.ljust(width) if has_style else LEGEND[6:]
 
 
 def emit_heading(heading: str, renderer: Renderer) -> None:
@@ -107,22 +158,31 @@ def emit_heading(heading: str, renderer: Renderer) -> None:
             f'string "{heading}" is not a valid heading, which starts with U+0001'
         )
 
+    # Headings decorated to the full width never exceed it; fit() only
+    # truncates those that don't fit in the first place.
+    renderer.emit_heading(
+        renderer.fit(_format_heading(heading, renderer.width, renderer.has_style))
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_heading(heading: str, width: int, has_style: bool) -> str:
     # Measure length before adding decorative elements.
     heading = heading[1:]
     heading_length = len(heading)
 
     left = FIXED_WIDTH - 1
-    if not renderer.has_style:
+    if not has_style:
         left -= 6
     heading = f'{"─" * left} {heading}'
 
-    right = renderer.width - FIXED_WIDTH - heading_length - 1
-    if right < 0:
-        heading = renderer.fit(heading, width=renderer.width)
-    else:
+    right = width - FIXED_WIDTH - heading_length - 1
+    if right >= 0:
         heading = f'{heading} {"─" * right}'
+    return heading
+
 
-    renderer.emit_heading(heading)
+_REPLACEMENT = str(CodePoint.REPLACEMENT_CHARACTER)
 
 
 def emit_blot(
@@ -133,38 +193,46 @@ def emit_blot(
     start_column: int = 1,
     presentation: Presentation = Presentation.NONE,
 ) -> None:
-    """Format the fixed-width character blot."""
+    """
+    Format the fixed-width character blot. The presentation and code points
+    must be normalized, as done by `make_presentable()`.
+    """
     # Determine display and width for blot. If the code points are an unassigned
-    # singleton or more than one grapheme cluster, their blots are elided.
-    presentation, codepoints = presentation.normalize(codepoints)
-
-    if not ucd.is_grapheme_cluster(codepoints):
-        display = "···"
-        width = 3
-    elif codepoints.is_singleton():
-        codepoint = codepoints.to_singleton()
-        if ucd.resolve(codepoint, General_Category) is General_Category.Unassigned:
+    # singleton or more than one grapheme cluster, their blots are elided. Since
+    # the code points are normalized, a singleton always is a CodePoint, which
+    # also always is a grapheme cluster.
+    if isinstance(codepoints, CodePoint):
+        if ucd.resolve(codepoints, General_Category) is General_Category.Unassigned:
             display = "···"
             width = 3
         else:
-            display = presentation.apply(codepoints.to_singleton())
+            display = presentation.apply(codepoints)
             width = ucd.width(display)
+    elif not ucd.is_grapheme_cluster(codepoints):
+        display = "···"
+        width = 3
     else:
         display = str(codepoints)
         width = ucd.width(codepoints)
 
     # Fail gracefully for control, surrogate, and private use characters.
     if width == -1:
-        width = 1
-        display = str(CodePoint.REPLACEMENT_CHARACTER)
+        display = _REPLACEMENT
+        padding = 2
+    else:
+        padding = 3 - width
 
     # Render Character Blots
-    renderer.adjust_column(start_column + 1)
-    renderer.emit_blot(display, Padding.BACKGROUND, 3 - width)
-    renderer.write(" ")
-    renderer.adjust_column(start_column + 7)
-    renderer.emit_blot(display, Padding.FOREGROUND, 3 - width)
-    renderer.write(" " if renderer.has_style else "   ")
+    adjust_column = renderer.adjust_column
+    emit = renderer.emit_blot
+    write = renderer.write
+
+    adjust_column(start_column + 1)
+    emit(display, Padding.BACKGROUND, padding)
+    write(" ")
+    adjust_column(start_column + 7)
+    emit(display, Padding.FOREGROUND, padding)
+    write(" " if renderer.has_style else "   ")
 
 
 def emit_info(
@@ -174,18 +242,26 @@ def emit_info(
     *,
     size: int = -1,
     presentation: Presentation = Presentation.NONE,
+    name_width: None | int = None,
 ) -> None:
-    """Format information about the code points."""
+    """
+    Format information about the code points. The presentation and code points
+    must be normalized, as done by `make_presentable()`. Callers emitting many
+    lines should compute the name width once and pass it in.
+    """
+    write = renderer.write
+    fit = renderer.fit
+    if name_width is None:
+        name_width = _name_width(renderer.width)
+
     renderer.adjust_column(len(LEGEND_BLOT) + 1 + 1)
-    renderer.write("   " if size == -1 else f"{size: 2d} ")
-
-    # For code points, if they have implicit presentation, switch to single code
-    # point and presentation instead. Otherwise, display the code points, plus
-    # age and name for emoji sequences, plus disclaimer for non-grapheme-clusters.
-    presentation, codepoints = presentation.normalize(codepoints)
-    if not codepoints.is_singleton():
-        renderer.write(
-            renderer.fit(
+    write("   " if size == -1 else f"{size: 2d} ")
+
+    # For sequences, display the code points, plus age and name for emoji
+    # sequences, plus disclaimer for non-grapheme-clusters.
+    if not isinstance(codepoints, CodePoint):
+        write(
+            fit(
                 repr(codepoints),
                 width=PROPS_WIDTH - SIZE_WIDTH - AGE_WIDTH - 1,
                 fill=True,
@@ -195,50 +271,45 @@ def emit_info(
         # Account for non-grapheme-clusters and emoji sequences.
         name = age = None
         if not ucd.is_grapheme_cluster(codepoints):
-            name = renderer.fit(
+            name = fit(
                 f"Not a grapheme cluster in UCD {ucd.version.in_short_format()}",
-                width=_name_width(renderer.width),
+                width=name_width,
             )
-            renderer.write(" " * (AGE_WIDTH + 1))
-            renderer.write(" ")
+            write(_BLANK_AGE + " ")
             renderer.faint(name)
             return
 
         name, age = ucd.emoji_sequence_data(codepoints)
         if age:
-            renderer.write(f" {age.in_emoji_format():>{AGE_WIDTH}}")
+            write(_format_sequence_age(age.in_emoji_format()))
         elif name:
-            renderer.write(" " * (AGE_WIDTH + 1))
+            write(_BLANK_AGE)
         if name:
-            renderer.write(f" {renderer.fit(name, width=_name_width(renderer.width))}")
+            write(f" {fit(name, width=name_width)}")
         return
 
     # A single code point: Display detailed metadata including presentation.
-    codepoint = codepoints.to_singleton()
+    codepoint = codepoints
     unidata = ucd.lookup(codepoint)
 
-    renderer.write(f"{codepoint!r:<8s} ")
-    vs = presentation.variation_selector
-    renderer.write(
-        f"{vs - CodePoint.VARIATION_SELECTOR_1 + 1:>2} " if vs > 0 else "   "
-    )
-    renderer.write(unidata.category.value)
-    renderer.write(f" {unidata.east_asian_width:<2} ")
-    flags = " ".join(f.value for f in unidata.flags)
-    renderer.write(renderer.fit(flags, width=25, fill=True))
-
     name = age = None
     if presentation is not Presentation.TEXT:
         name, age = ucd.emoji_sequence_data(presentation.apply(codepoint))
 
     age_display = "" if unidata.age is Age.Unassigned else str(unidata.age)
     age_display = age.in_emoji_format() if age else age_display
-    renderer.write(f" {age_display:>{AGE_WIDTH}} ")
+
+    # Write all fixed-width columns with a single format pass.
+    label = _VARIATION_SELECTOR_LABEL[presentation]
+    properties = _format_properties(
+        unidata.category, unidata.east_asian_width, unidata.flags
+    )
+    write(_format_fixed_columns(repr(codepoint), label, properties, age_display))
 
     if unidata.category is General_Category.Unassigned:
-        name = renderer.fit(
+        name = fit(
             f"Unassigned in UCD {ucd.version.in_short_format()}",
-            width=_name_width(renderer.width),
+            width=name_width,
         )
         renderer.faint(name)
         return
@@ -249,35 +320,79 @@ def emit_info(
         name = name + " "
     if block:
         name = f"{name}({block})"
-    renderer.write(renderer.fit(name, width=_name_width(renderer.width)))
+    write(fit(name, width=name_width))
 
 
 # --------------------------------------------------------------------------------------
 
 
+# Rendered lines or blots by presentation, code points, and name width or column.
+LineCache: TypeAlias = dict[
+    tuple[Presentation, CodePoint | CodePointSequence, int], str
+]
+
+
 def emit_lines(
-    stream: Iterable[tuple[Presentation, str | CodePoint | CodePointSequence]],
+    data: Sequence[tuple[Presentation, str | CodePoint | CodePointSequence]],
     renderer: Renderer,
     ucd: UnicodeCharacterDatabase,
     *,
+    start: int = 0,
+    stop: None | int = None,
     legend: None | str,
     incrementally: bool,
     probe: None | Probe = None,
+    cache: None | LineCache = None,
 ) -> int:
+    """
+    Emit one line per code point or heading, from the start index up to but
+    excluding the stop index. Unless rendering incrementally, this function
+    reuses lines from the optional cache, which must only be used with the same
+    renderer and UCD.
+    """
     label = Probe.PAGE_LINE_BY_LINE if incrementally else Probe.PAGE_AT_ONCE
     lines_printed = 0
+    name_width = _name_width(renderer.width)
+    # Only interactive, styled terminals report the cursor position, and each
+    # report is a round-trip through the terminal.
+    measure_size = incrementally and renderer.has_style and renderer.is_interactive
+    if incrementally:
+        cache = None
+    write = renderer.write
+    newline = renderer.newline
 
     with ExitStack() as stack:
         if probe:
             stack.enter_context(probe.measure(label))
+        if not incrementally:
+            # Collect the page's many small writes and emit them with one write.
+            stack.enter_context(renderer.buffering())
 
         if legend is not None:
             renderer.emit_legend(legend)
             renderer.newline()
 
-        for presentation, codepoints in stream:
+        for index in range(start, len(data) if stop is None else stop):
+            presentation, codepoints = data[index]
             if presentation.is_heading:
                 emit_heading(cast(str, codepoints), renderer)
+            elif cache is not None:
+                codepoints = cast(CodePoint | CodePointSequence, codepoints)
+                key = presentation, codepoints, name_width
+                line = cache.get(key)
+                if line is None:
+                    with renderer.buffering() as buffer:
+                        emit_blot(codepoints, renderer, ucd, presentation=presentation)
+                        emit_info(
+                            codepoints,
+                            renderer,
+                            ucd,
+                            presentation=presentation,
+                            name_width=name_width,
+                        )
+                        line = cache[key] = buffer.getvalue()
+                else:
+                    write(line)
             else:
                 emit_blot(
                     cast(CodePoint | CodePointSequence, codepoints),
@@ -287,7 +402,7 @@ def emit_lines(
                 )
 
                 size = -1
-                if incrementally:
+                if measure_size:
                     renderer.flush()
                     position = renderer.get_position()
                     size = -1 if position is None else position[1] - 9
@@ -298,9 +413,10 @@ def emit_lines(
                     ucd,
                     size=size,
                     presentation=presentation,
+                    name_width=name_width,
                 )
 
-            renderer.newline()
+            newline()
             lines_printed += 1
 
         renderer.flush()
@@ -319,31 +435,80 @@ def grid_column(index: int) -> int:
 
 
 def emit_grid(
-    stream: Iterable[tuple[Presentation, str | CodePoint | CodePointSequence]],
+    data: Sequence[tuple[Presentation, str | CodePoint | CodePointSequence]],
     renderer: Renderer,
     ucd: UnicodeCharacterDatabase,
     *,
+    start: int = 0,
+    stop: None | int = None,
     column_count: int,
-) -> None:
-    """Emit the compact, grid-like representation for all code points."""
-    # Ensure that every loop iteration consumes more code points
-    # stream = iter(data)
+    cache: None | LineCache = None,
+) -> int:
+    """
+    Emit the compact, grid-like representation for the code points from the
+    start index up to but excluding the stop index. This function returns the
+    number of rows printed. It reuses blots from the optional cache, which is
+    keyed by grid column instead of name width.
+    """
+    if stop is None:
+        stop = len(data)
+
+    rows_printed = 0
+    for index in range(start, stop):
+        presentation, codepoints = data[index]
+        codepoints = cast(CodePoint | CodePointSequence, codepoints)
+        column = (index - start) % column_count
+        if cache is None:
+            emit_blot(
+                codepoints,
+                renderer,
+                ucd,
+                presentation=presentation,
+                start_column=grid_column(column),
+            )
+        else:
+            key = presentation, codepoints, column
+            blot = cache.get(key)
+            if blot is None:
+                with renderer.buffering() as buffer:
+                    emit_blot(
+                        codepoints,
+                        renderer,
+                        ucd,
+                        presentation=presentation,
+                        start_column=grid_column(column),
+                    )
+                    blot = cache[key] = buffer.getvalue()
+            else:
+                renderer.write(blot)
+        if column == column_count - 1:
+            renderer.newline()
+            rows_printed += 1
 
-    for count, (presentation, codepoints) in enumerate(
-        itertools.islice(stream, column_count)
-    ):
-        emit_blot(
-            cast(CodePoint | CodePointSequence, codepoints),
-            renderer,
-            ucd,
-            presentation=presentation,
-            start_column=grid_column(count),
-        )
+    if (stop - start) % column_count != 0:
+        renderer.newline()
+        rows_printed += 1
+    return rows_printed
 
 
 # --------------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _layout_page(
+    width: int, height: int, has_style: bool, in_grid: bool
+) -> tuple[None | str, int, int]:
+    """
+    Determine legend, body height, and column count of a page. The layout only
+    changes when the terminal is resized, so this function is cached.
+    """
+    legend = None if in_grid else _format_legend(width, has_style)
+    legend_height = 0 if legend is None else legend.count("\n") + 1
+    body_height = height - legend_height - 1
+    column_count = (width - 2) // GRID_COLUMN_WIDTH if in_grid else 1
+    return legend, body_height, column_count
+
+
 def display(
     stream: Iterable[str | CodePoint | CodePointSequence],
     renderer: Renderer,
@@ -356,7 +521,8 @@ def display(
 ) -> None:
     data = [*make_presentable(stream, ucd, headings=not in_grid)]
     total_count = len(data)
-    start = stop = -1
+    line_cache: LineCache = {}
+    start = stop = 0
     action = Action.FORWARD
 
     with renderer.window_title(
@@ -365,18 +531,18 @@ def display(
         while True:
             renderer.refresh()
 
-            legend = None if in_grid else format_legend(renderer)
-            legend_height = 0 if legend is None else len(legend.splitlines())
-            body_height = renderer.height - legend_height - 1
-            column_count = (renderer.width - 2) // GRID_COLUMN_WIDTH if in_grid else 1
+            legend, body_height, column_count = _layout_page(
+                renderer.width, renderer.height, renderer.has_style, in_grid
+            )
             display_count = body_height * column_count
 
+            # Pages span from start up to but excluding stop.
             if action is Action.FORWARD:
-                start = stop + 1
+                start = stop
                 stop = min(start + display_count, total_count)
                 done = start >= total_count
             elif action is Action.BACKWARD:
-                stop = start - 1
+                stop = start
                 start = max(0, stop - display_count)
                 done = stop <= 0
             else:
@@ -386,31 +552,45 @@ def display(
             if done:
                 return
 
-            if in_grid:
-                emit_grid(
-                    data[start:stop],
-                    renderer,
-                    ucd,
-                    column_count=column_count,
-                )
-                blots_printed = stop - start + 1
-                lines_printed = math.ceil(blots_printed / column_count)
-            else:
-                lines_printed = emit_lines(
-                    data[start:stop],
-                    renderer,
-                    ucd,
-                    legend=legend,
-                    incrementally=incrementally,
-                    probe=probe,
-                )
+            # Unless rendering incrementally, write the entire page at once and
+            # have the terminal display it as one frame. A probe measures page
+            # latency in emit_lines(), which buffers by itself.
+            with ExitStack() as stack:
+                if not incrementally and probe is None:
+                    stack.enter_context(renderer.buffering())
+                    stack.enter_context(renderer.synchronized_output())
+
+                if in_grid:
+                    lines_printed = emit_grid(
+                        data,
+                        renderer,
+                        ucd,
+                        start=start,
+                        stop=stop,
+                        column_count=column_count,
+                        cache=None if probe is not None else line_cache,
+                    )
+                else:
+                    lines_printed = emit_lines(
+                        data,
+                        renderer,
+                        ucd,
+                        start=start,
+                        stop=stop,
+                        legend=legend,
+                        incrementally=incrementally,
+                        probe=probe,
+                        # A probe must time the same rendering work for pages
+                        # drawn at once and line by line, so don't replay lines.
+                        cache=None if probe is not None else line_cache,
+                    )
 
-            if renderer.is_interactive:
                 # Make sure we fill the page with lines
-                if lines_printed < body_height:
+                if renderer.is_interactive and lines_printed < body_height:
                     for _ in range(body_height - lines_printed):
                         renderer.newline()
 
+            if renderer.is_interactive:
                 action = read_action(renderer)
                 if action is Action.TERMINATE:
                     return
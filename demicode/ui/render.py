@@ -18,6 +18,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import StrEnum
+import functools
 import io
 import os
 import sys
@@ -46,6 +47,10 @@ def _CHA(column: int | str) -> str:
     return f"{_CSI}{column}G"
 
 
+# Column adjustments happen several times per blot, so look them up.
+_CHA_BY_COLUMN = tuple(_CHA(column) for column in range(256))
+
+
 def _bg(color: int | str) -> str:
     return f"48;5;{color}"
 
@@ -54,6 +59,17 @@ def _fg(color: int | str) -> str:
     return f"38;5;{color}"
 
 
+@functools.lru_cache(maxsize=256)
+def fit_text(text: str, width: int, *, fill: bool = False) -> str:
+    """
+    Fit the text into the width. Since demicode redraws the same headings,
+    flags, and names whenever paging back and forth, this function is cached.
+    """
+    if len(text) <= width:
+        return text.ljust(width) if fill else text
+    return text[: width - 1] + "…"
+
+
 @dataclass(frozen=True, slots=True)
 class Theme:
     legend: str
@@ -120,6 +136,10 @@ class Padding(StrEnum):
     FOREGROUND = "█"
 
 
+# Foreground padding for the plain renderer, indexed by width.
+_FOREGROUND_PADDING = tuple(Padding.FOREGROUND.value * width for width in range(4))
+
+
 # --------------------------------------------------------------------------------------
 # Reading Key Presses
 
@@ -282,6 +302,10 @@ class Renderer:
     def window_title(self, text: str) -> Iterator[None]:
         yield
 
+    @contextmanager
+    def synchronized_output(self) -> Iterator[None]:
+        yield
+
     # ----------------------------------------------------------------------------------
     # Terminal Properties Including Size
 
@@ -360,11 +384,7 @@ class Renderer:
     # Format Text
 
     def fit(self, text: str, *, width: None | int = None, fill: bool = False) -> str:
-        if width is None:
-            width = self.width
-        if len(text) <= width:
-            return text.ljust(width) if fill else text
-        return text[: width - 1] + "…"
+        return fit_text(text, self.width if width is None else width, fill=fill)
 
     # ----------------------------------------------------------------------------------
     # Output Formatted Text
@@ -398,7 +418,14 @@ class Renderer:
 
     def emit_blot(self, text: str, padding: Padding, width: int) -> None:
         if padding is Padding.FOREGROUND:
-            self._output.write(text + (padding.value * width))
+            self._output.write(
+                text
+                + (
+                    _FOREGROUND_PADDING[width]
+                    if 0 <= width < len(_FOREGROUND_PADDING)
+                    else padding.value * width
+                )
+            )
 
     def emit_error(self, text: str) -> None:
         self._output.write(text)
@@ -459,6 +486,18 @@ class Renderer:
 class StyledRenderer(Renderer):
     """A line-oriented console renderer using ANSI escape codes."""
 
+    def __init__(self, input: TextIO, output: TextIO, theme: Theme) -> None:
+        super().__init__(input, output, theme)
+        # Blots are padded by at most three cells, so precompute their suffixes.
+        self._blot_suffix = {
+            (padding, width): f"{style}{padding.value * width}{Style.RESET}"
+            for padding, style in (
+                (Padding.BACKGROUND, theme.blot_highlight),
+                (Padding.FOREGROUND, theme.blot_obstruction),
+            )
+            for width in range(4)
+        }
+
     @property
     def has_style(self) -> bool:
         return True
@@ -476,6 +515,21 @@ class StyledRenderer(Renderer):
                 self._output.write(f"{_OSC}0;{_ST}{_CSI}23;0t")
                 self._output.flush()
 
+    @contextmanager
+    def synchronized_output(self) -> Iterator[None]:
+        """
+        Have the terminal display all output inside a `with
+        renderer.synchronized_output()` block as one frame. Terminals that do
+        not support synchronized output ignore the escape sequences.
+        """
+        if self.is_interactive:
+            self._output.write(f"{_CSI}?2026h")
+        try:
+            yield
+        finally:
+            if self.is_interactive:
+                self._output.write(f"{_CSI}?2026l")
+
     def query(self, query: str) -> bytes:
         if not query.startswith("\x1B"):
             query = f"\x1B{query}"
@@ -493,7 +547,9 @@ class StyledRenderer(Renderer):
         return int(row), int(column)
 
     def adjust_column(self, column: int) -> None:
-        self._output.write(_CHA(column))
+        self._output.write(
+            _CHA_BY_COLUMN[column] if column < len(_CHA_BY_COLUMN) else _CHA(column)
+        )
 
     def faint(self, text: str) -> None:
         self._output.write(f"{self._theme.faint}{text}{Style.RESET}")
@@ -519,20 +575,15 @@ class StyledRenderer(Renderer):
         self._output.write(f"{self._theme.heading}{text}{Style.RESET}")
 
     def emit_blot(self, text: str, padding: Padding, width: int) -> None:
-        self._output.write(
-            "".join(
-                [
-                    text,
-                    (
-                        self._theme.blot_highlight
-                        if padding is Padding.BACKGROUND
-                        else self._theme.blot_obstruction
-                    ),
-                    padding.value * width,
-                    Style.RESET,
-                ]
+        suffix = self._blot_suffix.get((padding, max(width, 0)))
+        if suffix is None:
+            style = (
+                self._theme.blot_highlight
+                if padding is Padding.BACKGROUND
+                else self._theme.blot_obstruction
             )
-        )
+            suffix = f"{style}{padding.value * width}{Style.RESET}"
+        self._output.write(text + suffix)
 
     def emit_error(self, text: str) -> None:
         """Emit the error text. This method flushes output."""
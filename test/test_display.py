@@ -0,0 +1,124 @@
+from collections.abc import Iterator
+import io
+import math
+from typing import Any
+import unittest
+from unittest.mock import patch
+
+from demicode.db.codepoint import CodePoint
+from demicode.db.model import Presentation
+from demicode.db.ucd import UnicodeCharacterDatabase
+from demicode.display import display, emit_grid, make_presentable
+from demicode.ui.action import Action
+from demicode.ui.render import Renderer, Style
+
+
+# Box drawing characters have neither variation selectors nor emoji sequences.
+BOX_DRAWING = [CodePoint(cp) for cp in range(0x2500, 0x2580)]
+
+
+class PagingRenderer(Renderer):
+    """An interactive renderer with a fixed size."""
+
+    def __init__(self) -> None:
+        super().__init__(io.StringIO(), io.StringIO(), Style.LIGHT[0])
+        self._interactive = True
+
+    def refresh(self) -> None:
+        self._width, self._height = 100, 15
+
+
+class TestDisplay(unittest.TestCase):
+    ucd: UnicodeCharacterDatabase
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ucd = UnicodeCharacterDatabase("ucd")
+
+    def test_presentations(self) -> None:
+        NONE, TEXT, EMOJI = Presentation.NONE, Presentation.TEXT, Presentation.EMOJI
+        for char, presentations in (
+            ("A", [NONE]),
+            ("\uFF01", [Presentation.CORNER, Presentation.CENTER]),
+            ("\u2764", [NONE, TEXT, EMOJI]),
+            ("#", [NONE, TEXT, EMOJI, Presentation.KEYCAP]),
+        ):
+            with self.subTest(char=char):
+                codepoint = CodePoint.of(char)
+                self.assertEqual(
+                    [*make_presentable([codepoint], self.ucd)],
+                    [(p, codepoint) for p in presentations],
+                )
+
+    def test_grid_rows(self) -> None:
+        data = [*make_presentable(BOX_DRAWING, self.ucd, headings=False)]
+        self.assertEqual(len(data), len(BOX_DRAWING))
+        column_count = 7
+
+        # Full rows only, a trailing partial row, and a lone code point.
+        for start, stop in ((0, 21), (5, 28), (100, 128), (127, 128)):
+            with self.subTest(start=start, stop=stop):
+                output = io.StringIO()
+                renderer = Renderer(io.StringIO(), output, Style.LIGHT[0])
+                rows = emit_grid(
+                    data,
+                    renderer,
+                    self.ucd,
+                    start=start,
+                    stop=stop,
+                    column_count=column_count,
+                )
+
+                expected = math.ceil((stop - start) / column_count)
+                self.assertEqual(rows, expected)
+                self.assertEqual(output.getvalue().count("\n"), expected)
+
+    def page(self, *actions: Action) -> list[tuple[int, int]]:
+        """Display box drawing characters and return the pages' index ranges."""
+        pages: list[tuple[int, int]] = []
+
+        def emit_lines(*_: Any, start: int, stop: int, **__: Any) -> int:
+            pages.append((start, stop))
+            return stop - start
+
+        action_iter: Iterator[Action] = iter(actions)
+        with patch("demicode.display.emit_lines", emit_lines):
+            display(
+                BOX_DRAWING,
+                PagingRenderer(),
+                self.ucd,
+                read_action=lambda _: next(action_iter, Action.TERMINATE),
+            )
+        return pages
+
+    def test_paging(self) -> None:
+        # The first page determines the page size for the fixed-size renderer.
+        [(first, size)] = self.page()
+        total = len(BOX_DRAWING)
+        self.assertEqual(first, 0)
+        self.assertNotEqual(total % size, 0, "last page must be short")
+        count = math.ceil(total / size)
+        self.assertGreater(count, 2)
+        last = (count - 1) * size
+
+        # Paging forward covers every index exactly once, in half-open ranges,
+        # and ends with the short last page.
+        pages = self.page(*[Action.FORWARD] * (count + 5))
+        self.assertEqual(len(pages), count)
+        self.assertEqual(pages[0], (0, size))
+        self.assertEqual(pages[-1], (last, total))
+        self.assertEqual(
+            [index for start, stop in pages for index in range(start, stop)],
+            [*range(total)],
+        )
+
+        # Paging back from the short last page yields a full page.
+        pages = self.page(*[Action.FORWARD] * (count - 1), Action.BACKWARD)
+        self.assertEqual(pages[-2:], [(last, total), (last - size, last)])
+
+        # Paging back to the first page yields the same first page, whereas
+        # paging back from the first page ends the display.
+        pages = self.page(Action.FORWARD, Action.BACKWARD, Action.BACKWARD)
+        self.assertEqual(pages, [(0, size), (size, 2 * size), (0, size)])
+        pages = self.page(Action.BACKWARD, Action.FORWARD)
+        self.assertEqual(pages, [(0, size)])
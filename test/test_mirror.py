@@ -1,6 +1,18 @@
+import dataclasses
+from datetime import datetime, timezone
+from email.message import Message
+import io
+import json
+from pathlib import Path
+import random
+import tarfile
+import tempfile
 import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
 
-from demicode.db.mirror import Mirror
+from demicode.db.mirror import CLDR, FileManager, Manifest, Mirror
 from demicode.db.version import Version, VersionError
 
 
@@ -52,3 +64,290 @@ class TestMirror(unittest.TestCase):
             self.mirror.url("emoji-data.txt", Version(13, 0, 0)),
             "https://www.unicode.org/Public/13.0.0/ucd/emoji/emoji-data.txt",
         )
+
+
+# --------------------------------------------------------------------------------------
+# Conditional requests against a fake origin
+
+
+README_URL = "https://www.unicode.org/Public/UCD/latest/ReadMe.txt"
+ANNOTATIONS_URL = "https://registry.npmjs.org/cldr-annotations-modern"
+DERIVED_URL = "https://registry.npmjs.org/cldr-annotations-derived-modern"
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, data: bytes, etag: None | str = None) -> None:
+        super().__init__(data)
+        self.headers = Message()
+        if etag is not None:
+            self.headers["ETag"] = etag
+
+
+def readme(version: str) -> bytes:
+    return f"Files for Version {version} of the Unicode Standard\n".encode()
+
+
+def cldr_metadata(url: str, version: str) -> bytes:
+    tarball = f"{url}/-/{version}.tgz"
+    return json.dumps({
+        "dist-tags": {"latest": version},
+        "versions": {version: {"dist": {"tarball": tarball}}},
+    }).encode()
+
+
+class FakeOrigin:
+    """
+    A fake origin server, which answers conditional requests with 304 if the
+    entity tag is current. It also records each request's If-None-Match header.
+    """
+
+    def __init__(self, ucd: str = "15.1.0", cldr: str = "44.0.0") -> None:
+        self.ucd = ucd
+        self.cldr = cldr
+        self.requests: list[tuple[str, None | str]] = []
+
+    def etag(self, url: str) -> str:
+        return f'"{self.ucd if url == README_URL else self.cldr}"'
+
+    def __call__(self, request: Request, timeout: float) -> FakeResponse:
+        url = request.full_url
+        if_none_match = request.get_header("If-none-match")
+        self.requests.append((url, if_none_match))
+        if if_none_match == self.etag(url):
+            raise HTTPError(url, 304, "Not Modified", Message(), None)
+        if url == README_URL:
+            return FakeResponse(readme(self.ucd), self.etag(url))
+        return FakeResponse(cldr_metadata(url, self.cldr), self.etag(url))
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.mirror = Path(self.tmpdir.name) / "ucd"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_fresh_response_records_etags(self) -> None:
+        origin = FakeOrigin()
+        previous = Manifest.from_file(self.mirror)
+        with patch("demicode.db.mirror.urlopen", origin):
+            manifest = Manifest.from_origin(self.mirror, previous)
+
+        self.assertEqual(manifest.ucd, Version(15, 1, 0))
+        self.assertEqual(manifest.cldr.version, Version(44, 0, 0))
+        self.assertEqual(
+            dict(manifest.etags),
+            {
+                README_URL: '"15.1.0"',
+                ANNOTATIONS_URL: '"44.0.0"',
+                DERIVED_URL: '"44.0.0"',
+            },
+        )
+        hash(manifest)
+
+        # A manifest's entity tags survive being saved and loaded again.
+        restored = Manifest.from_dict(
+            json.loads(json.dumps(manifest.to_dict())) | {"mirror": str(self.mirror)}
+        )
+        self.assertEqual(restored.etags, manifest.etags)
+
+    def test_without_previous_etag_no_if_none_match(self) -> None:
+        origin = FakeOrigin()
+        previous = Manifest.from_file(self.mirror)
+        self.assertEqual(previous.etags, ())
+        with patch("demicode.db.mirror.urlopen", origin):
+            Manifest.from_origin(self.mirror, previous)
+
+        self.assertEqual(
+            origin.requests,
+            [(README_URL, None), (ANNOTATIONS_URL, None), (DERIVED_URL, None)],
+        )
+
+    def test_not_modified_falls_back_on_previous(self) -> None:
+        origin = FakeOrigin()
+        with patch("demicode.db.mirror.urlopen", origin):
+            previous = Manifest.from_origin(
+                self.mirror, Manifest.from_file(self.mirror)
+            )
+            origin.requests.clear()
+            manifest = Manifest.from_origin(self.mirror, previous)
+
+        self.assertEqual(
+            origin.requests,
+            [(README_URL, '"15.1.0"'), (ANNOTATIONS_URL, '"44.0.0"')],
+        )
+        self.assertEqual(manifest.ucd, previous.ucd)
+        self.assertEqual(manifest.cldr, previous.cldr)
+        self.assertEqual(manifest.etags, previous.etags)
+
+    def test_new_annotations_refetch_unmodified_derived(self) -> None:
+        origin = FakeOrigin()
+        with patch("demicode.db.mirror.urlopen", origin):
+            previous = Manifest.from_origin(
+                self.mirror, Manifest.from_file(self.mirror)
+            )
+
+            # The annotations have a new version, but the derived annotations'
+            # entity tag somehow already is current.
+            origin.cldr = "45.0.0"
+            etags = dict(previous.etags) | {DERIVED_URL: '"45.0.0"'}
+            previous = dataclasses.replace(previous, etags=tuple(etags.items()))
+            origin.requests.clear()
+            manifest = Manifest.from_origin(self.mirror, previous)
+
+        self.assertEqual(
+            origin.requests[1:],
+            [
+                (ANNOTATIONS_URL, '"44.0.0"'),
+                (DERIVED_URL, '"45.0.0"'),
+                (DERIVED_URL, None),
+            ],
+        )
+        self.assertEqual(manifest.cldr.version, Version(45, 0, 0))
+        self.assertEqual(
+            manifest.cldr.derived_annotations, f"{DERIVED_URL}/-/45.0.0.tgz"
+        )
+
+
+class TestRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.files = FileManager(Path(self.tmpdir.name), Version(15, 1, 0))
+        self.path = self.files.path("UnicodeData.txt", Version(15, 1, 0))
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_transient_errors_are_retried(self) -> None:
+        errors: list[HTTPError] = []
+
+        def urlopen(request: Request, timeout: float) -> FakeResponse:
+            if len(errors) < 2:
+                errors.append(HTTPError(
+                    request.full_url, 503, "Unavailable", Message(), io.BytesIO()
+                ))
+                raise errors[-1]
+            return FakeResponse(b"data")
+
+        with (
+            patch("demicode.db.mirror.urlopen", urlopen),
+            patch("demicode.db.mirror.time.sleep") as sleep,
+        ):
+            self.files.retrieve("https://example.com/UnicodeData.txt", self.path)
+
+        self.assertEqual(self.path.read_bytes(), b"data")
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertTrue(all(error.fp.closed for error in errors))
+
+    def test_client_errors_are_not_retried(self) -> None:
+        attempts = 0
+
+        def urlopen(request: Request, timeout: float) -> FakeResponse:
+            nonlocal attempts
+            attempts += 1
+            raise HTTPError(request.full_url, 404, "Not Found", Message(), None)
+
+        with (
+            patch("demicode.db.mirror.urlopen", urlopen),
+            patch("demicode.db.mirror.time.sleep") as sleep,
+        ):
+            with self.assertRaises(HTTPError):
+                self.files.retrieve("https://example.com/UnicodeData.txt", self.path)
+
+        self.assertEqual(attempts, 1)
+        sleep.assert_not_called()
+
+
+class TestOfflineSetup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.mirror = Path(self.tmpdir.name) / "ucd"
+        self.mirror.mkdir()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def offline(request: Request, timeout: float) -> FakeResponse:
+        raise URLError("offline")
+
+    def test_stale_manifest_when_offline(self) -> None:
+        stale = Manifest(
+            Manifest.SCHEMA,
+            self.mirror,
+            Version(15, 1, 0),
+            (Version(15, 1, 0),),
+            CLDR(Version(44, 0, 0), "annotations.tgz", "derived-annotations.tgz"),
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+        ).save_manifest()
+
+        with (
+            patch("demicode.db.mirror.urlopen", self.offline),
+            self.assertLogs("demicode.db.mirror", "WARNING"),
+        ):
+            manifest = Manifest.setup(self.mirror)
+
+        self.assertEqual(manifest, stale)
+
+    def test_no_manifest_when_offline(self) -> None:
+        with patch("demicode.db.mirror.urlopen", self.offline):
+            with self.assertRaises(URLError):
+                Manifest.setup(self.mirror)
+
+
+class TestFailedRetrieval(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_ucd_file_leaves_no_temporary_file(self) -> None:
+        def urlopen(request: Request, timeout: float) -> FakeResponse:
+            response = FakeResponse(b"not gzip at all")
+            response.headers["Content-Encoding"] = "gzip"
+            return response
+
+        files = FileManager(self.root, Version(15, 1, 0))
+        path = files.path("UnicodeData.txt", Version(15, 1, 0))
+        with patch("demicode.db.mirror.urlopen", urlopen):
+            with self.assertRaises(OSError):
+                files.retrieve("https://example.com/UnicodeData.txt", path)
+
+        self.assertEqual([*path.parent.iterdir()], [])
+
+    def test_cldr_annotations_leave_no_temporary_file(self) -> None:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tarball:
+            info = tarfile.TarInfo("package/annotations/en/annotations.json")
+            data = random.randbytes(100_000)
+            info.size = len(data)
+            tarball.addfile(info, io.BytesIO(data))
+        truncated = buffer.getvalue()[:50_000]
+
+        def urlopen(request: Request, timeout: float) -> FakeResponse:
+            return FakeResponse(truncated)
+
+        cldr = CLDR(Version(44, 0, 0), "https://example.com/a.tgz", "")
+        with patch("demicode.db.mirror.urlopen", urlopen):
+            with self.assertRaises(tarfile.ReadError):
+                cldr.retrieve(
+                    cldr.annotations,
+                    "package/annotations/en/annotations.json",
+                    self.root,
+                    "annotations",
+                )
+
+        self.assertEqual([*self.root.iterdir()], [])
+
+    def test_unreleased_file_does_not_chain_exceptions(self) -> None:
+        files = FileManager(self.root, Version(15, 1, 0))
+        with self.assertRaises(KeyError) as context:
+            with files.data("IndicSyllabicCategory.txt", Version(5, 0, 0)) as file:
+                self.assertEqual(file.read(), "")
+                raise KeyError("caller")
+
+        self.assertIsNone(context.exception.__context__)